@@ -2,7 +2,8 @@ import json
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, TypeVar
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar
 
 # Type alias for field specifications
 # Format: (header_name, property_name, type_converter, default_value)
@@ -41,6 +42,59 @@ def _int_or_zero(x: Any) -> int:
         return 0
 
 
+# FIELD_MAP is fixed per class, so header names are collected once per class.
+_SHEET_HEADERS_CACHE: Dict[type, Tuple[str, ...]] = {}
+
+
+def _field_map_headers_tuple(cls: Type[Any]) -> Tuple[str, ...]:
+    """Return the cached header names of a FIELD_MAP model."""
+    try:
+        return _SHEET_HEADERS_CACHE[cls]
+    except KeyError:
+        headers = tuple(h for h, _, _, _ in cls.FIELD_MAP)
+        _SHEET_HEADERS_CACHE[cls] = headers
+        return headers
+
+
+def _field_map_headers(cls: Type[Any]) -> List[str]:
+    """Return a fresh header list for a FIELD_MAP model."""
+    return list(_field_map_headers_tuple(cls))
+
+
+# Per-class header -> attrgetter for stored (non-computed) columns.
+_FIELD_GETTER_CACHE: Dict[type, Dict[str, Callable[[Any], Any]]] = {}
+
+
+def _field_map_value(obj: Any, header: str) -> Any:
+    """Get the sheet cell value of a stored FIELD_MAP column.
+
+    Enums are written as their value and None as an empty string; headers
+    without a backing field yield "".
+    """
+    cls = type(obj)
+    try:
+        getters = _FIELD_GETTER_CACHE[cls]
+    except KeyError:
+        getters = {h: attrgetter(prop) for h, prop, _, _ in cls.FIELD_MAP if prop}
+        _FIELD_GETTER_CACHE[cls] = getters
+
+    getter = getters.get(header)
+    if getter is None:
+        return ""
+    val = getter(obj)
+    # Handle enums
+    if isinstance(val, Enum):
+        return val.value
+    # Handle None -> empty string
+    return val if val is not None else ""
+
+
+def _field_map_row(obj: Any) -> List[Any]:
+    """Build a sheet row for a FIELD_MAP model via its ``_get_row_value``."""
+    get_value = obj._get_row_value
+    return [get_value(h) for h in _field_map_headers_tuple(type(obj))]
+
+
 # TaoStats API Response Models
 
 
@@ -521,25 +575,16 @@ class AlphaLot:
         elif header == "Long Term Date":
             return self.long_term_date
 
-        # Find the field spec
-        for h, prop, _, _ in self.FIELD_MAP:
-            if h == header and prop:
-                val = getattr(self, prop)
-                # Handle enums
-                if isinstance(val, Enum):
-                    return val.value
-                # Handle None -> empty string
-                return val if val is not None else ""
-        return ""
+        return _field_map_value(self, header)
 
     def to_sheet_row(self) -> List[Any]:
         """Convert to Google Sheets row using FIELD_MAP."""
-        return [self._get_row_value(h) for h, _, _, _ in self.FIELD_MAP]
+        return _field_map_row(self)
 
     @classmethod
     def sheet_headers(cls) -> List[str]:
         """Get column headers from FIELD_MAP."""
-        return [h for h, _, _, _ in cls.FIELD_MAP]
+        return _field_map_headers(cls)
 
     @classmethod
     def from_record(cls, record: Dict[str, Any]) -> "AlphaLot":
@@ -687,22 +732,16 @@ class TaoLot:
         elif header == "TAO Remaining":
             return self.tao_remaining
 
-        for h, prop, _, _ in self.FIELD_MAP:
-            if h == header and prop:
-                val = getattr(self, prop)
-                if isinstance(val, Enum):
-                    return val.value
-                return val if val is not None else ""
-        return ""
+        return _field_map_value(self, header)
 
     def to_sheet_row(self) -> List[Any]:
         """Convert to Google Sheets row using FIELD_MAP."""
-        return [self._get_row_value(h) for h, _, _, _ in self.FIELD_MAP]
+        return _field_map_row(self)
 
     @classmethod
     def sheet_headers(cls) -> List[str]:
         """Get column headers from FIELD_MAP."""
-        return [h for h, _, _, _ in cls.FIELD_MAP]
+        return _field_map_headers(cls)
 
     @classmethod
     def from_record(cls, record: Dict[str, Any]) -> "TaoLot":
@@ -799,22 +838,16 @@ class AlphaSale:
         elif header == "Consumed Lots":
             return self.consumed_lots_json()
 
-        for h, prop, _, _ in self.FIELD_MAP:
-            if h == header and prop:
-                val = getattr(self, prop)
-                if isinstance(val, Enum):
-                    return val.value
-                return val if val is not None else ""
-        return ""
+        return _field_map_value(self, header)
 
     def to_sheet_row(self) -> List[Any]:
         """Convert to Google Sheets row using FIELD_MAP."""
-        return [self._get_row_value(h) for h, _, _, _ in self.FIELD_MAP]
+        return _field_map_row(self)
 
     @classmethod
     def sheet_headers(cls) -> List[str]:
         """Get column headers from FIELD_MAP."""
-        return [h for h, _, _, _ in cls.FIELD_MAP]
+        return _field_map_headers(cls)
 
     @classmethod
     def _parse_consumed_lots(cls, raw: Any) -> List[AlphaLotConsumption]:
@@ -910,22 +943,16 @@ class TaoTransfer:
         elif header == "Consumed TAO Lots":
             return self.consumed_tao_lots_json()
 
-        for h, prop, _, _ in self.FIELD_MAP:
-            if h == header and prop:
-                val = getattr(self, prop)
-                if isinstance(val, Enum):
-                    return val.value
-                return val if val is not None else ""
-        return ""
+        return _field_map_value(self, header)
 
     def to_sheet_row(self) -> List[Any]:
         """Convert to Google Sheets row using FIELD_MAP."""
-        return [self._get_row_value(h) for h, _, _, _ in self.FIELD_MAP]
+        return _field_map_row(self)
 
     @classmethod
     def sheet_headers(cls) -> List[str]:
         """Get column headers from FIELD_MAP."""
-        return [h for h, _, _, _ in cls.FIELD_MAP]
+        return _field_map_headers(cls)
 
     @classmethod
     def _parse_consumed_tao_lots(cls, raw: Any) -> List[TaoLotConsumption]:
@@ -1038,22 +1065,16 @@ class Expense:
         elif header == "Consumed Lots":
             return self.consumed_lots_json()
 
-        for h, prop, _, _ in self.FIELD_MAP:
-            if h == header and prop:
-                val = getattr(self, prop)
-                if isinstance(val, Enum):
-                    return val.value
-                return val if val is not None else ""
-        return ""
+        return _field_map_value(self, header)
 
     def to_sheet_row(self) -> List[Any]:
         """Convert to Google Sheets row using FIELD_MAP."""
-        return [self._get_row_value(h) for h, _, _, _ in self.FIELD_MAP]
+        return _field_map_row(self)
 
     @classmethod
     def sheet_headers(cls) -> List[str]:
         """Get column headers from FIELD_MAP."""
-        return [h for h, _, _, _ in cls.FIELD_MAP]
+        return _field_map_headers(cls)
 
     @classmethod
     def _parse_consumed_lots(cls, raw: Any) -> List[AlphaLotConsumption]:
@@ -1132,22 +1153,16 @@ class TaoDeposit:
         if header == "Date":
             return self.date
 
-        for h, prop, _, _ in self.FIELD_MAP:
-            if h == header and prop:
-                val = getattr(self, prop)
-                if isinstance(val, Enum):
-                    return val.value
-                return val if val is not None else ""
-        return ""
+        return _field_map_value(self, header)
 
     def to_sheet_row(self) -> List[Any]:
         """Convert to Google Sheets row using FIELD_MAP."""
-        return [self._get_row_value(h) for h, _, _, _ in self.FIELD_MAP]
+        return _field_map_row(self)
 
     @classmethod
     def sheet_headers(cls) -> List[str]:
         """Get column headers from FIELD_MAP."""
-        return [h for h, _, _, _ in cls.FIELD_MAP]
+        return _field_map_headers(cls)
 
     @classmethod
     def from_record(cls, record: Dict[str, Any]) -> "TaoDeposit":
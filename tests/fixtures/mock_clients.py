@@ -5,9 +5,12 @@ Provides mock implementations of API clients that use real test data
 and filter it based on method arguments.
 """
 
-import json
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
@@ -21,7 +24,42 @@ from emissions_tracker.models import (
     TaoStatsStakeBalance,
     TaoStatsTransfer,
 )
-from tests.fixtures.mock_data import TEST_DATA_DIR
+from tests.fixtures.mock_data import TEST_DATA_DIR, load_json
+
+
+def _iso_to_epoch(timestamp: str) -> float:
+    """Convert a TaoStats ISO timestamp ("...Z") to Unix seconds.
+
+    Keeps the fractional part so sorting matches the API's timestamp order;
+    callers truncate with int() for range filters.
+    """
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+
+
+@lru_cache(maxsize=None)
+def _load_timestamped_records(path: Path) -> List[Tuple[float, Dict[str, Any]]]:
+    """Load a TaoStats ``data`` list paired with each record's Unix timestamp.
+
+    Timestamps are parsed once here instead of on every filter call.
+    """
+    return [
+        (_iso_to_epoch(record["timestamp"]), record)
+        for record in load_json(path)["data"]
+    ]
+
+
+@lru_cache(maxsize=None)
+def _load_price_series(path: Path) -> Tuple[List[int], List[float]]:
+    """Load historical prices as parallel, timestamp-sorted lists.
+
+    Sorting once lets the price lookups bisect instead of scanning every
+    entry per call.
+    """
+    entries = sorted(load_json(path).values(), key=itemgetter("timestamp"))
+    return (
+        [entry["timestamp"] for entry in entries],
+        [float(entry["price"]) for entry in entries],
+    )
 
 
 class MockTaoStatsClient(WalletClientInterface, PriceClient):
@@ -45,30 +83,32 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
     def _load_test_data(self):
         """Load all test data files from the configured data directory."""
         # Load delegations/stake events
-        with open(self.data_dir / "stake_events.json") as f:
-            self._raw_delegations = json.load(f)["data"]
+        # Records are (unix_seconds, raw_record) pairs
+        self._raw_delegations = _load_timestamped_records(
+            self.data_dir / "stake_events.json"
+        )
 
         # Load transfers
-        with open(self.data_dir / "transfers.json") as f:
-            self._raw_transfers = json.load(f)["data"]
+        self._raw_transfers = _load_timestamped_records(
+            self.data_dir / "transfers.json"
+        )
 
         # Load stake balance history
-        with open(self.data_dir / "stake_balance.json") as f:
-            self._raw_stake_balance = json.load(f)["data"]
+        self._raw_stake_balance = _load_timestamped_records(
+            self.data_dir / "stake_balance.json"
+        )
 
         # Load account history
         account_history_path = self.data_dir / "account_history.json"
         if account_history_path.exists():
-            with open(account_history_path) as f:
-                self._raw_account_history = json.load(f)["data"]
+            self._raw_account_history = _load_timestamped_records(account_history_path)
         else:
             self._raw_account_history = []
 
         # Load price data (always from main directory, shared across all tests)
-        with open(TEST_DATA_DIR / "historical_tao_prices.json") as f:
-            price_dict = json.load(f)
-            # Convert dict to list for easier searching
-            self._raw_prices = list(price_dict.values())
+        self._price_timestamps, self._prices = _load_price_series(
+            TEST_DATA_DIR / "historical_tao_prices.json"
+        )
 
     @property
     def name(self) -> str:
@@ -91,14 +131,8 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
         """
         filtered = []
 
-        for event in self._raw_delegations:
-            # Parse timestamp
-            event_ts = int(
-                datetime.fromisoformat(
-                    event["timestamp"].replace("Z", "+00:00")
-                ).timestamp()
-            )
-
+        for event_epoch, event in self._raw_delegations:
+            event_ts = int(event_epoch)
             # Apply time filter (inclusive on both ends)
             if event_ts < start_time or event_ts > end_time:
                 continue
@@ -158,15 +192,11 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
                 ),
                 fee=event.get("fee"),
             )
-            filtered.append(delegation)
+            filtered.append((event_epoch, delegation))
 
         # Sort by timestamp ascending to match real API behavior (order="timestamp_asc")
-        filtered.sort(
-            key=lambda d: datetime.fromisoformat(
-                d.timestamp.replace("Z", "+00:00")
-            ).timestamp()
-        )
-        return filtered
+        filtered.sort(key=itemgetter(0))
+        return [delegation for _, delegation in filtered]
 
     def get_transfers(
         self,
@@ -179,14 +209,8 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
         """Filter and return transfers matching criteria."""
         filtered = []
 
-        for transfer in self._raw_transfers:
-            # Parse timestamp
-            transfer_ts = int(
-                datetime.fromisoformat(
-                    transfer["timestamp"].replace("Z", "+00:00")
-                ).timestamp()
-            )
-
+        for transfer_epoch, transfer in self._raw_transfers:
+            transfer_ts = int(transfer_epoch)
             # Apply filters
             if transfer_ts < start_time or transfer_ts > end_time:
                 continue
@@ -221,15 +245,11 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
                     ss58=transfer["to"]["ss58"], hex=transfer["to"]["hex"]
                 ),
             )
-            filtered.append(transfer_obj)
+            filtered.append((transfer_epoch, transfer_obj))
 
         # Sort by timestamp ascending to match real API behavior (order="timestamp_asc")
-        filtered.sort(
-            key=lambda t: datetime.fromisoformat(
-                t.timestamp.replace("Z", "+00:00")
-            ).timestamp()
-        )
-        return filtered
+        filtered.sort(key=itemgetter(0))
+        return [transfer_obj for _, transfer_obj in filtered]
 
     def get_stake_balance_history(
         self, netuid: int, hotkey: str, coldkey: str, start_time: int, end_time: int
@@ -237,14 +257,8 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
         """Filter and return stake balance history matching criteria."""
         filtered = []
 
-        for balance in self._raw_stake_balance:
-            # Parse timestamp
-            balance_ts = int(
-                datetime.fromisoformat(
-                    balance["timestamp"].replace("Z", "+00:00")
-                ).timestamp()
-            )
-
+        for balance_epoch, balance in self._raw_stake_balance:
+            balance_ts = int(balance_epoch)
             # Apply filters
             if balance_ts < start_time or balance_ts > end_time:
                 continue
@@ -283,14 +297,8 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
         """Filter and return account history matching criteria."""
         filtered = []
 
-        for history in self._raw_account_history:
-            # Parse timestamp
-            history_ts = int(
-                datetime.fromisoformat(
-                    history["timestamp"].replace("Z", "+00:00")
-                ).timestamp()
-            )
-
+        for history_epoch, history in self._raw_account_history:
+            history_ts = int(history_epoch)
             # Apply filters
             if history_ts < start_time or history_ts > end_time:
                 continue
@@ -319,28 +327,29 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
                 created_on_network=history.get("created_on_network"),
                 coldkey_swap=history.get("coldkey_swap"),
             )
-            filtered.append(history_obj)
+            filtered.append((history_epoch, history_obj))
 
         # Sort by timestamp ascending to match real API behavior (order="timestamp_asc")
-        filtered.sort(
-            key=lambda h: datetime.fromisoformat(
-                h.timestamp.replace("Z", "+00:00")
-            ).timestamp()
-        )
-        return filtered
+        filtered.sort(key=itemgetter(0))
+        return [history_obj for _, history_obj in filtered]
 
     def get_price_at_timestamp(self, symbol: str, timestamp: int) -> float:
         """Get price at specific timestamp (finds closest)."""
         if symbol != "TAO":
             raise PriceNotAvailableError(f"Only TAO prices available, got {symbol}")
 
-        if not self._raw_prices:
+        timestamps = self._price_timestamps
+        if not timestamps:
             raise PriceNotAvailableError("No price data available")
 
-        # Find closest price by timestamp
-        closest = min(self._raw_prices, key=lambda p: abs(p["timestamp"] - timestamp))
+        # Find closest price by timestamp; ties go to the earlier entry
+        idx = bisect_left(timestamps, timestamp)
+        if idx == len(timestamps) or (
+            idx > 0 and timestamp - timestamps[idx - 1] <= timestamps[idx] - timestamp
+        ):
+            idx -= 1
 
-        return float(closest["price"])
+        return self._prices[idx]
 
     def get_prices_in_range(
         self, symbol: str, start_time: int, end_time: int
@@ -349,29 +358,25 @@ class MockTaoStatsClient(WalletClientInterface, PriceClient):
         if symbol != "TAO":
             raise PriceNotAvailableError(f"Only TAO prices available, got {symbol}")
 
-        filtered = []
-        for price_data in self._raw_prices:
-            price_ts = price_data["timestamp"]
-
-            if start_time <= price_ts <= end_time:
-                filtered.append(
-                    {"timestamp": price_ts, "price": float(price_data["price"])}
-                )
+        timestamps = self._price_timestamps
+        lo = bisect_left(timestamps, start_time)
+        hi = bisect_right(timestamps, end_time)
 
-        return sorted(filtered, key=lambda x: x["timestamp"])
+        return [
+            {"timestamp": timestamps[i], "price": self._prices[i]}
+            for i in range(lo, hi)
+        ]
 
     def get_current_price(self, symbol: str) -> float:
         """Get most recent price."""
         if symbol != "TAO":
             raise PriceNotAvailableError(f"Only TAO prices available, got {symbol}")
 
-        if not self._raw_prices:
+        if not self._prices:
             raise PriceNotAvailableError("No price data available")
 
         # Get most recent price
-        latest = max(self._raw_prices, key=lambda p: p["timestamp"])
-
-        return float(latest["price"])
+        return self._prices[-1]
 
 
 @pytest.fixture
@@ -1,6 +1,9 @@
 import json
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
@@ -25,10 +28,10 @@ from tests.fixtures.mock_config import (
     TEST_VALIDATOR_SS58,
 )
 from tests.utils import (
+    compute_staking_emissions_from_balances,
     consume_alpha_lots_for_expense,
     consume_alpha_lots_for_sale,
     consume_tao_lots,
-    filter_delegation_events_by_date_range,
 )
 
 # Test data directory
@@ -36,6 +39,17 @@ TEST_DATA_DIR = Path(__file__).parent.parent / "data" / "contract"
 SECONDS_PER_DAY = 86400
 
 
+@lru_cache(maxsize=None)
+def load_json(path: Path) -> Any:
+    """Parse a test data file once per process.
+
+    Shared by the raw_* fixtures and the mock TaoStats clients, which read the
+    same files. The returned data is shared and must be treated as read-only.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
 class HistoricalPrices:
     """Helper class to manage historical TAO price data for tests.
 
@@ -51,6 +65,16 @@ class HistoricalPrices:
                        Each price dict should have: date, timestamp, price
         """
         self._data = price_data
+        # Parse prices once, keyed both by date string and by days since the
+        # Unix epoch so timestamp lookups are integer division + dict get
+        self._prices: Dict[str, float] = {
+            date: float(entry["price"]) for date, entry in price_data.items()
+        }
+        epoch = datetime(1970, 1, 1).date()
+        self._prices_by_epoch_day: Dict[int, float] = {
+            (datetime.strptime(date, "%Y-%m-%d").date() - epoch).days: price
+            for date, price in self._prices.items()
+        }
 
     def get_price_for_date(self, date: str) -> float:
         """Get price for a specific date string.
@@ -64,9 +88,10 @@ class HistoricalPrices:
         Raises:
             ValueError: If date not found in historical data
         """
-        if date in self._data:
-            return float(self._data[date]["price"])
-        raise ValueError(f"No historical price data for {date}")
+        try:
+            return self._prices[date]
+        except KeyError:
+            raise ValueError(f"No historical price data for {date}") from None
 
     def get_price_for_datetime(self, dt: datetime) -> float:
         """Get price for a datetime object.
@@ -95,8 +120,11 @@ class HistoricalPrices:
         Raises:
             ValueError: If date not found in historical data
         """
-        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        return self.get_price_for_datetime(dt)
+        try:
+            return self._prices_by_epoch_day[int(timestamp) // SECONDS_PER_DAY]
+        except KeyError:
+            dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+            return self.get_price_for_datetime(dt)
 
     def get_all_prices(self) -> Dict[str, Any]:
         """Get the raw price data dict.
@@ -118,44 +146,38 @@ class HistoricalPrices:
         return date in self._data
 
 
-@pytest.fixture
+# Raw JSON fixtures are parsed once per session. Consumers only read them
+# (models are built via from_json), so they must not be mutated in place.
+
+
+@pytest.fixture(scope="session")
 def raw_account_history():
     """Load raw account history data from test data."""
-    data_path = TEST_DATA_DIR / "account_history.json"
-    with open(data_path) as f:
-        return json.load(f)["data"]
+    return load_json(TEST_DATA_DIR / "account_history.json")["data"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def raw_stake_events():
     """Load raw stake events from test data."""
-    data_path = TEST_DATA_DIR / "stake_events.json"
-    with open(data_path) as f:
-        return json.load(f)["data"]
+    return load_json(TEST_DATA_DIR / "stake_events.json")["data"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def raw_stake_balance():
     """Load raw stake balance history from test data."""
-    data_path = TEST_DATA_DIR / "stake_balance.json"
-    with open(data_path) as f:
-        return json.load(f)["data"]
+    return load_json(TEST_DATA_DIR / "stake_balance.json")["data"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def raw_transfer_events():
     """Load raw transfer events from test data."""
-    data_path = TEST_DATA_DIR / "transfers.json"
-    with open(data_path) as f:
-        return json.load(f)["data"]
+    return load_json(TEST_DATA_DIR / "transfers.json")["data"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def raw_historical_prices():
     """Load raw historical price data from test data."""
-    data_path = TEST_DATA_DIR / "historical_tao_prices.json"
-    with open(data_path) as f:
-        return json.load(f)
+    return load_json(TEST_DATA_DIR / "historical_tao_prices.json")
 
 
 @pytest.fixture
@@ -179,7 +201,7 @@ def stake_events(raw_stake_events):
     return stake_events
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def stake_balances(raw_stake_balance):
     """Load stake balance data from test data."""
     stake_balances = []
@@ -197,30 +219,36 @@ def transfer_events(raw_transfer_events):
     return transfer_events
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def historical_prices(raw_historical_prices):
     """Load historical price data from test data.
 
+    The price indexes are built once per session; HistoricalPrices is
+    read-only, so every test shares the same instance.
+
     Returns HistoricalPrices instance with convenient lookup methods.
     """
     return HistoricalPrices(raw_historical_prices)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def daily_stake_balances(
     stake_balances: list[TaoStatsStakeBalance],
 ) -> Dict[str, TaoStatsStakeBalance]:
     """Group stake balances by day, keeping only the last balance of each day.
 
+    Built once per session; balances are only read (lots are derived from
+    them), so the day index is shared across tests.
+
     Returns list of TaoStatsStakeBalance objects, one per day.
     """
     balances_by_day: Dict[str, TaoStatsStakeBalance] = {}
     for b in stake_balances:
-        if b.day in balances_by_day:
-            if b.timestamp > balances_by_day[b.day].timestamp:
-                balances_by_day[b.day] = b
-        else:
-            balances_by_day[b.day] = b
+        # b.day parses the ISO timestamp, so derive it once per balance
+        day = b.day
+        current = balances_by_day.get(day)
+        if current is None or b.timestamp > current.timestamp:
+            balances_by_day[day] = b
 
     return balances_by_day
 
@@ -415,12 +443,16 @@ def get_opening_tao_lot(
     historical_prices: HistoricalPrices,
 ):
 
+    # Index histories by day once (first record wins, matching a linear scan)
+    # so each lookup doesn't re-parse every record's ISO timestamp
+    histories_by_day: Dict[str, TaoStatsAccountHistory] = {}
+    for ah in account_histories:
+        histories_by_day.setdefault(ah.day, ah)
+
     def _get_opening_tao_lot(date: datetime):
         # Get balance from previous day
         target_date_str = (date - timedelta(days=1)).strftime("%Y-%m-%d")
-        account_history = next(
-            ah for ah in account_histories if ah.day == target_date_str
-        )
+        account_history = histories_by_day[target_date_str]
         tao_balance_rao = account_history.balance_free_rao
         tao_price = historical_prices.get_price_for_date(target_date_str)
 
@@ -451,23 +483,19 @@ def get_opening_alpha_lot(
     def _get_opening_alpha_lot(date: datetime):
         # Get balance from previous day
         target_date_str = (date - timedelta(days=1)).strftime("%Y-%m-%d")
-        balance = next(
-            b for b in daily_stake_balances.values() if b.day == target_date_str
-        )
+        # daily_stake_balances is already keyed by day
+        balance = daily_stake_balances[target_date_str]
         tao_price = historical_prices.get_price_for_date(target_date_str)
+        alpha_rao = balance.balance_as_alpha_rao
         usd_fmv = balance.balance_as_tao_float * tao_price
-        usd_per_alpha = (
-            (balance.balance_as_tao_float * tao_price) / balance.balance_as_alpha_float
-            if balance.balance_as_alpha_rao > 0
-            else 0
-        )
+        usd_per_alpha = usd_fmv / (alpha_rao / 1e9) if alpha_rao > 0 else 0
 
         return AlphaLot(
             lot_id=get_alpha_lot_id(),
             timestamp=int(date.timestamp()) - 1,
             block_number=balance.block_number,
-            alpha_rao=balance.balance_as_alpha_rao,
-            alpha_rao_remaining=balance.balance_as_alpha_rao,
+            alpha_rao=alpha_rao,
+            alpha_rao_remaining=alpha_rao,
             usd_per_alpha=usd_per_alpha,
             usd_fmv=usd_fmv,
             tao_equivalent=balance.balance_as_tao_float,
@@ -500,6 +528,19 @@ def compute_expected_contract_income_lots(
         List of stake events matching contract income criteria
     """
 
+    # Incoming transfer delegations, paired with their parsed timestamp and
+    # sorted once so each call only compares ints instead of re-parsing ISO
+    # strings for the range filter, the sort and the lot timestamp.
+    income_candidates: list[tuple[int, TaoStatsDelegation]] = sorted(
+        (
+            (e.timestamp_unix, e)
+            for e in stake_events
+            if e.action == "DELEGATE" and e.transfer_address
+        ),
+        key=itemgetter(0),
+    )
+    income_timestamps = [ts for ts, _ in income_candidates]
+
     def _compute_expected_contract_income_lots(
         start_ts: int,
         end_ts: int,
@@ -508,35 +549,34 @@ def compute_expected_contract_income_lots(
         delegate: str = TEST_VALIDATOR_SS58,
         nominator: str = TEST_PAYOUT_COLDKEY_SS58,
     ) -> List[AlphaLot]:
-        filtered_events = filter_delegation_events_by_date_range(
-            stake_events, start_ts, end_ts
-        )
+        # Narrow to the window by bisecting; a window outside the data
+        # yields an empty slice without scanning any events
+        lo = bisect_left(income_timestamps, start_ts)
+        hi = bisect_right(income_timestamps, end_ts)
         transfer_income_events = [
-            event
-            for event in filtered_events
+            (ts, event)
+            for ts, event in income_candidates[lo:hi]
             if (
-                event.action == "DELEGATE"
-                and event.netuid == netuid
+                event.netuid == netuid
                 and event.delegate.ss58 == delegate
                 and event.nominator.ss58 == nominator
-                and event.transfer_address
             )
         ]
         lots = []
-        for e in transfer_income_events:
+        for ts, e in transfer_income_events:
             is_contract = e.transfer_address.ss58 == contract_address
             source = SourceType.CONTRACT if is_contract else SourceType.TRANSFER_IN
+            alpha_rao = int(e.alpha)
+            usd_fmv = float(e.usd)
             lots.append(
                 AlphaLot(
                     lot_id=get_alpha_lot_id(),
-                    timestamp=e.timestamp_unix,
+                    timestamp=ts,
                     block_number=e.block_number,
-                    alpha_rao=int(e.alpha),
-                    alpha_rao_remaining=int(e.alpha),
-                    usd_per_alpha=(
-                        float(e.usd) / (int(e.alpha) / 1e9) if int(e.alpha) > 0 else 0
-                    ),
-                    usd_fmv=float(e.usd),
+                    alpha_rao=alpha_rao,
+                    alpha_rao_remaining=alpha_rao,
+                    usd_per_alpha=usd_fmv / (alpha_rao / 1e9) if alpha_rao > 0 else 0,
+                    usd_fmv=usd_fmv,
                     tao_equivalent=e.tao,
                     extrinsic_id=e.extrinsic_id,
                     transfer_address=(
@@ -564,15 +604,22 @@ def compute_expected_staking_emission_lots(
     Returns a function that computes emission lots for a given date range.
     """
 
+    balance_timestamps = [b.timestamp_unix for b in daily_stake_balances.values()]
+    first_ts = min(balance_timestamps, default=0)
+    last_ts = max(balance_timestamps, default=-1)
+
     def _compute_expected_staking_emissions(
         start_date: datetime, end_date: datetime
     ) -> list[AlphaLot]:
         """Compute expected staking emissions from raw data."""
-        from tests.utils import compute_staking_emissions_from_balances
-
         start_ts = int(start_date.timestamp())
         end_ts = int(end_date.timestamp())
 
+        # The balance window reaches back one day for the prior balance; if
+        # it misses the data entirely there is nothing to filter or group
+        if end_ts < first_ts or start_ts - SECONDS_PER_DAY > last_ts:
+            return []
+
         return compute_staking_emissions_from_balances(
             daily_stake_balances=daily_stake_balances,
             daily_stake_events=daily_stake_events,
@@ -609,6 +656,22 @@ def compute_expected_expenses(
         List of expected expense dictionaries with computed values
     """
 
+    # Expense candidates (UNDELEGATE with is_transfer=True to non-smart-contract)
+    # don't depend on the date range, so classify them once per fixture.
+    # Pair each with its parsed timestamp and sort chronologically up front to
+    # match MockTaoStatsClient's timestamp_asc order without re-parsing per call.
+    expense_candidates: list[tuple[int, TaoStatsDelegation]] = sorted(
+        (
+            (e.timestamp_unix, e)
+            for e in stake_events
+            if e.action == "UNDELEGATE"
+            and e.is_transfer is True
+            and e.transfer_address is not None
+            and e.transfer_address.ss58 != TEST_SMART_CONTRACT_SS58
+        ),
+        key=itemgetter(0),
+    )
+
     def _compute_expected_expenses(
         alpha_lots: list[AlphaLot],
         start_date: datetime,
@@ -624,21 +687,10 @@ def compute_expected_expenses(
 
         alpha_lots = copy.deepcopy(alpha_lots)
 
-        # Load expense events from the same file (UNDELEGATE with is_transfer=True to non-smart-contract)
-        expense_undelegates: list[TaoStatsDelegation] = []
-        for e in stake_events:
-            if (
-                e.action == "UNDELEGATE"
-                and e.is_transfer == True
-                and e.transfer_address is not None
-                and e.transfer_address.ss58 != TEST_SMART_CONTRACT_SS58
-                and start_ts <= e.timestamp_unix <= end_ts
-            ):
-                expense_undelegates.append(e)
-
-        # Sort expenses chronologically to match MockTaoStatsClient behavior
-        # The mock client now returns delegations in timestamp_asc order
-        expense_undelegates.sort(key=lambda x: x.timestamp_unix)
+        # Narrow the pre-sorted expense events to the date range
+        expense_undelegates: list[TaoStatsDelegation] = [
+            e for ts, e in expense_candidates if start_ts <= ts <= end_ts
+        ]
 
         # Process each expense
         expected_expenses = []
@@ -754,6 +806,17 @@ def compute_expected_sales(
         cost_basis, tao_slippage, network_fee_tao, network_fee_usd, realized_gain_loss
     """
 
+    # User-initiated sales (UNDELEGATE with is_transfer=None) paired with their
+    # parsed timestamps and sorted once, so each call only narrows by date
+    sale_candidates: list[tuple[int, TaoStatsDelegation]] = sorted(
+        (
+            (e.timestamp_unix, e)
+            for e in stake_events
+            if e.action == "UNDELEGATE" and e.is_transfer is None
+        ),
+        key=itemgetter(0),
+    )
+
     def _compute_expected_sales(
         start_date: datetime,
         end_date: datetime,
@@ -790,18 +853,8 @@ def compute_expected_sales(
             for i, lot in enumerate(alpha_lots, start=1):
                 lot.lot_id = f"ALPHA-{i:04d}"
 
-            # Step 2: Process UNDELEGATE events as sales
-            # Filter for UNDELEGATE events with is_transfer=None (user-initiated sales)
-            sales = [
-                e
-                for e in stake_events
-                if e.action == "UNDELEGATE"
-                and e.is_transfer is None
-                and start_ts <= e.timestamp_unix <= end_ts
-            ]
-
-            # Sort by timestamp
-            sales.sort(key=lambda x: x.timestamp_unix)
+            # Step 2: Process UNDELEGATE events as sales (already sorted by timestamp)
+            sales = [sale for ts, sale in sale_candidates if start_ts <= ts <= end_ts]
 
             expected_sales = []
             tao_lots = []
@@ -912,20 +965,21 @@ def compute_expected_transfers(
 
             # Step 2: Load and process transfer events
             # Filter transfers to brokerage in date range
+            # Keep each transfer's parsed timestamp alongside it for the sort
             brokerage_transfers = [
-                e
+                (ts, e)
                 for e in transfer_events
                 if e.to_address is not None
                 and e.to_address.ss58 == brokerage_address
                 and e.from_address is not None
                 and e.from_address.ss58 == wallet_address
-                and start_ts <= e.timestamp_unix <= end_ts
+                and start_ts <= (ts := e.timestamp_unix) <= end_ts
             ]
 
             # Sort transfers chronologically (oldest first)
             # Note: We're reading from raw JSON which is in reverse chronological order
             # The MockTaoStatsClient sorts its output, but this function reads raw JSON directly
-            brokerage_transfers.sort(key=lambda x: x.timestamp_unix)
+            brokerage_transfers.sort(key=itemgetter(0))
 
             # Sort TAO lots for consumption based on cost basis method
             if cost_basis_method == CostBasisMethod.FIFO:
@@ -939,7 +993,7 @@ def compute_expected_transfers(
 
             # Step 5: Process each transfer chronologically
             expected_transfers = []
-            for taostats_transfer in brokerage_transfers:
+            for _, taostats_transfer in brokerage_transfers:
                 # Round timestamp to nearest day (add half day before truncating)
                 timestamp = (
                     (taostats_transfer.timestamp_unix + SECONDS_PER_DAY // 2)
@@ -3,7 +3,6 @@
 Loads test data from tests/data/mining/ for mining tracker tests.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict
@@ -11,20 +10,20 @@ from typing import Callable, Dict
 import pytest
 
 from emissions_tracker.models import AlphaLot, SourceType, TaoStatsStakeBalance
+from tests.fixtures.mock_data import load_json
+from tests.utils import compute_staking_emissions_from_balances
 
 # Mining test data directory
 MINING_TEST_DATA_DIR = Path(__file__).parent.parent / "data" / "mining"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mining_raw_stake_balance():
     """Load raw stake balance history from mining test data."""
-    data_path = MINING_TEST_DATA_DIR / "stake_balance.json"
-    with open(data_path) as f:
-        return json.load(f)["data"]
+    return load_json(MINING_TEST_DATA_DIR / "stake_balance.json")["data"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mining_stake_balances(mining_raw_stake_balance):
     """Load stake balance data from mining test data."""
     stake_balances = []
@@ -33,7 +32,7 @@ def mining_stake_balances(mining_raw_stake_balance):
     return stake_balances
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mining_daily_stake_balances(
     mining_stake_balances: list[TaoStatsStakeBalance],
 ) -> Dict[str, TaoStatsStakeBalance]:
@@ -43,11 +42,11 @@ def mining_daily_stake_balances(
     """
     balances_by_day: Dict[str, TaoStatsStakeBalance] = {}
     for b in mining_stake_balances:
-        if b.day in balances_by_day:
-            if b.timestamp > balances_by_day[b.day].timestamp:
-                balances_by_day[b.day] = b
-        else:
-            balances_by_day[b.day] = b
+        # b.day parses the ISO timestamp, so derive it once per balance
+        day = b.day
+        current = balances_by_day.get(day)
+        if current is None or b.timestamp > current.timestamp:
+            balances_by_day[day] = b
 
     return balances_by_day
 
@@ -71,8 +70,6 @@ def compute_expected_mining_staking_emission_lots(
         start_date: datetime, end_date: datetime
     ) -> list[AlphaLot]:
         """Compute expected staking emissions from mining balance history."""
-        from tests.utils import compute_staking_emissions_from_balances
-
         start_ts = int(start_date.timestamp())
         end_ts = int(end_date.timestamp())
 
@@ -18,15 +18,23 @@ Usage:
         assert income_sheet.append_row_calls == 3
 """
 
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from emissions_tracker.models import AlphaLot, SourceType, TaoLot
-from emissions_tracker.utils import initialize_sheets
+from emissions_tracker.trackers.contract_tracker import (
+    INCOME_SHEET,
+    SHEET_CONFIGS,
+    TAO_LOTS_SHEET,
+    TRANSFERS_IN_SHEET,
+)
+from emissions_tracker.utils import col_letter_to_idx, initialize_sheets
 from tests.fixtures.mock_config import (
     TEST_PAYOUT_COLDKEY_SS58,
     TEST_SMART_CONTRACT_SS58,
@@ -35,24 +43,77 @@ from tests.fixtures.mock_config import (
     TEST_VALIDATOR_SS58,
 )
 
+# Optional sheet prefix plus the start cell of an A1 range, e.g.
+# "Sheet!B12:C12" -> ("Sheet", "B", "12"); "B12" -> (None, "B", "12")
+_RANGE_RE = re.compile(r"^(?:([^!]+)!)?([A-Za-z]+)(\d+)")
+
+# Both corners of an A1 range, e.g. "A2:Z100" -> ("A", "2", "Z", "100");
+# a single cell "B3" leaves the end groups as None
+_SPAN_RE = re.compile(r"^(?:[^!]+!)?([A-Za-z]+)(\d+)(?::([A-Za-z]+)(\d+))?$")
+
+# Column letters seen so far -> 1-based index. Sheets only use a handful of
+# columns, so this saturates after the first few updates.
+_COL_CACHE: Dict[str, int] = {}
+
+# ASCII code point -> column digit (A/a=1 .. Z/z=26); anything else is 0
+_COL_VAL = [0] * 128
+for _i, _c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ", 1):
+    _COL_VAL[ord(_c)] = _COL_VAL[ord(_c.lower())] = _i
+del _i, _c
+
 
 def column_letter_to_index(letters: str) -> int:
-    """Convert Excel-style column letters to 0-based index."""
+    """Convert Excel-style column letters to 1-based index."""
+    try:
+        return _COL_CACHE[letters]
+    except KeyError:
+        pass
     value = 0
-    for ch in letters.upper():
-        if not ch.isalpha():
-            continue
-        value = value * 26 + (ord(ch) - ord("A") + 1)
+    for ch in letters:
+        code = ord(ch)
+        v = _COL_VAL[code] if code < 128 else 0
+        if v:
+            value = value * 26 + v
+    _COL_CACHE[letters] = value
     return value
 
 
-@dataclass
+def _cell_update(match: re.Match, update: Dict[str, Any]) -> Tuple[int, int, Any]:
+    """Resolve a ``_RANGE_RE`` match to a 0-based (row, col, value) cell write."""
+    row_index = int(match.group(3)) - 1  # header is at rows[0]
+    col_index = column_letter_to_index(match.group(2)) - 1
+    return row_index, col_index, update["values"][0][0]
+
+
+def _fit_row(row: List[Any], width: int) -> List[Any]:
+    """Copy a row, padded with "" or truncated to ``width`` cells.
+
+    Full-width rows (the common case) are a plain copy; short rows are padded
+    and long rows truncated directly, without a concatenate-then-slice round
+    trip.
+    """
+    if len(row) == width:
+        return list(row)
+    elif len(row) < width:
+        padded = list(row)
+        padded.extend([""] * (width - len(row)))
+        return padded
+    else:
+        return list(row[:width])
+
+
+@dataclass(slots=True)
 class WorksheetOperation:
-    """Record of a single worksheet operation."""
+    """Record of a single worksheet operation.
+
+    Operations are kept in call order on ``MockWorksheet.operations``, so no
+    per-record clock read is needed to sequence them. Row, value and range
+    payloads are copied into tuples so later mutation by the caller cannot
+    rewrite the history.
+    """
 
     operation_type: str  # "append_row", "append_rows", "batch_update", "clear", "sort"
     data: Any
-    timestamp: float = field(default_factory=lambda: __import__("time").time())
 
 
 class MockWorksheet:
@@ -66,21 +127,48 @@ class MockWorksheet:
     - Current state of rows
     """
 
-    def __init__(self, name: str, spreadsheet=None):
+    __slots__ = (
+        "name",
+        "title",
+        "headers",
+        "spreadsheet",
+        "rows",
+        "operations",
+        "record_operations",
+        "append_row_calls",
+        "append_rows_calls",
+        "batch_update_calls",
+        "clear_calls",
+        "sort_calls",
+        "get_all_records_calls",
+        "_records_cache",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        spreadsheet=None,
+        headers: Optional[List[str]] = None,
+        record_operations: bool = False,
+    ):
         """
         Initialize worksheet with name and headers.
 
         Args:
             name: Worksheet name
-            headers: List of column names for the first row
             spreadsheet: Parent MockSpreadsheet reference
+            headers: Optional column names, written as the first row
+            record_operations: Keep a WorksheetOperation log of every write
         """
         self.name = name
         self.title = name
-        self.headers = []
+        self.headers = list(headers) if headers else []
         self.spreadsheet = spreadsheet
-        self.rows: List[List[Any]] = []
+        self.rows: List[List[Any]] = [list(self.headers)] if self.headers else []
         self.operations: List[WorksheetOperation] = []
+        # Off by default: counters cover most assertions, and the log costs an
+        # allocation per write. Can be toggled per worksheet at any time.
+        self.record_operations = record_operations
 
         # Call counters
         self.append_row_calls = 0
@@ -90,16 +178,25 @@ class MockWorksheet:
         self.sort_calls = 0
         self.get_all_records_calls = 0
 
+        # get_all_records() result, dropped by every mutating method
+        self._records_cache: Optional[List[Dict[str, Any]]] = None
+
     def get_all_records(self) -> List[Dict[str, Any]]:
         """
         Get all rows as dictionaries (like gspread's get_all_records()).
 
-        Uses the first row as headers (matching gspread behavior).
+        Uses the first row as headers (matching gspread behavior). The records
+        are cached until the next mutating call and each call returns a new
+        list of them, so callers may reorder or extend the list but must not
+        edit the record dicts. Code that edits ``rows`` directly bypasses
+        invalidation.
 
         Returns:
             List of dictionaries with header keys and row values
         """
         self.get_all_records_calls += 1
+        if self._records_cache is not None:
+            return list(self._records_cache)
 
         # If no rows or only header row, return empty list
         if len(self.rows) <= 1:
@@ -107,18 +204,16 @@ class MockWorksheet:
 
         # Use first row as headers
         headers = self.rows[0]
+        width = len(headers)
 
-        # Convert remaining rows to dicts
+        # Convert remaining rows to dicts, padding short rows with ""
         results = []
         for row in self.rows[1:]:
-            record = {}
-            for idx, header in enumerate(headers):
-                if idx < len(row):
-                    record[header] = row[idx]
-                else:
-                    record[header] = ""
-            results.append(record)
-        return results
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            results.append(dict(zip(headers, row)))
+        self._records_cache = results
+        return list(results)
 
     def get_all_values(self) -> List[List[Any]]:
         return self.rows
@@ -147,17 +242,12 @@ class MockWorksheet:
             **kwargs: Additional arguments (ignored, for compatibility)
         """
         self.append_row_calls += 1
-
-        # Special handling for header rows (first row on empty sheet)
-        if not self.rows and len(row) > 1:
-            # This looks like a header row - set it as headers
-            self.headers = list(row)
-
-        # Pad row to match current header length
+        self._records_cache = None
         self.rows.append(row)
-        self.operations.append(
-            WorksheetOperation(operation_type="append_row", data=row)
-        )
+        if self.record_operations:
+            self.operations.append(
+                WorksheetOperation(operation_type="append_row", data=tuple(row))
+            )
 
     def append_rows(self, rows: List[List[Any]], **kwargs):
         """
@@ -168,12 +258,16 @@ class MockWorksheet:
             **kwargs: Additional arguments (ignored, for compatibility)
         """
         self.append_rows_calls += 1
-        for row in rows:
-            padded = list(row) + [""] * max(0, len(self.headers) - len(row))
-            self.rows.append(padded[: len(self.headers)])
-        self.operations.append(
-            WorksheetOperation(operation_type="append_rows", data=rows)
-        )
+        self._records_cache = None
+        width = len(self.headers)
+        # Fit every row to the header width and add them in one extend
+        self.rows.extend([_fit_row(row, width) for row in rows])
+        if self.record_operations:
+            self.operations.append(
+                WorksheetOperation(
+                    operation_type="append_rows", data=tuple(map(tuple, rows))
+                )
+            )
 
     def batch_update(self, data: List[Dict[str, Any]], **kwargs):
         """
@@ -183,38 +277,44 @@ class MockWorksheet:
             data: List of update dictionaries with 'range' and 'values' keys
             **kwargs: Additional arguments (ignored, for compatibility)
         """
-        self.batch_update_calls += 1
-        for update in data:
-            range_str = update["range"]
-            values = update["values"]
-
-            # Parse range like "Sheet!A2:B2" or "A2" or "A2:A2"
-            if "!" in range_str:
-                range_str = range_str.split("!")[1]
-
-            # Parse single cell or single-cell range (A2 or A2:A2)
-            if ":" in range_str:
-                start_cell = range_str.split(":")[0]
-            else:
-                start_cell = range_str
+        # Parse range like "Sheet!A2:B2" or "A2" or "A2:A2"
+        cells = [_cell_update(_RANGE_RE.match(u["range"]), u) for u in data]
+        self._apply_cells(cells, data)
 
-            # Parse cell address
-            col_letters = "".join(c for c in start_cell if c.isalpha())
-            row_num = int("".join(c for c in start_cell if c.isdigit()))
-            col_index = column_letter_to_index(col_letters) - 1
-            row_index = row_num - 1  # Convert to 0-based (header is at rows[0])
-
-            # Ensure row exists
-            while len(self.rows) <= row_index:
-                self.rows.append([""] * len(self.headers))
-
-            # Update cell
-            if 0 <= col_index < len(self.headers):
-                self.rows[row_index][col_index] = values[0][0]
+    def _apply_cells(
+        self, cells: List[Tuple[int, int, Any]], data: List[Dict[str, Any]]
+    ):
+        """Write pre-parsed cells as one batch_update call.
 
-        self.operations.append(
-            WorksheetOperation(operation_type="batch_update", data=data)
-        )
+        Args:
+            cells: (row_index, col_index, value) triples, 0-based
+            data: The update dictionaries the cells came from, for the log
+        """
+        self.batch_update_calls += 1
+        self._records_cache = None
+        width = len(self.headers)
+
+        # Ensure the furthest row touched by this batch exists
+        if cells:
+            missing_rows = max(cell[0] for cell in cells) + 1 - len(self.rows)
+            if missing_rows > 0:
+                self.rows.extend([[""] * width for _ in range(missing_rows)])
+
+        # Update cells
+        rows = self.rows
+        for row_index, col_index, value in cells:
+            if 0 <= col_index < width:
+                rows[row_index][col_index] = value
+
+        if self.record_operations:
+            self.operations.append(
+                WorksheetOperation(
+                    operation_type="batch_update",
+                    data=tuple(
+                        (u["range"], tuple(map(tuple, u["values"]))) for u in data
+                    ),
+                )
+            )
 
     def update(self, cell_range: str, values: List[List[Any]], **kwargs):
         """
@@ -226,16 +326,11 @@ class MockWorksheet:
             **kwargs: Additional arguments (ignored, for compatibility)
         """
         self.batch_update_calls += 1
+        self._records_cache = None
 
         # Parse range like "A2:B2"
-        if ":" in cell_range:
-            start_cell = cell_range.split(":")[0]
-        else:
-            start_cell = cell_range
-
-        # Parse cell address
-        col_letters = "".join(c for c in start_cell if c.isalpha())
-        row_num = int("".join(c for c in start_cell if c.isdigit()))
+        _, col_letters, row_num = _RANGE_RE.match(cell_range).groups()
+        row_num = int(row_num)
         col_index = column_letter_to_index(col_letters) - 1
         row_index = row_num - 1  # Convert to 0-based (header is at rows[0])
 
@@ -244,8 +339,9 @@ class MockWorksheet:
             target_row_index = row_index + row_offset
 
             # Ensure row exists
-            while len(self.rows) <= target_row_index:
-                self.rows.append([])
+            missing_rows = target_row_index + 1 - len(self.rows)
+            if missing_rows > 0:
+                self.rows.extend([[] for _ in range(missing_rows)])
 
             # Ensure row has enough columns
             if len(self.rows[target_row_index]) < col_index + len(value_row):
@@ -262,11 +358,13 @@ class MockWorksheet:
         if row_index == 0:
             self.headers = self.rows[0]
 
-        self.operations.append(
-            WorksheetOperation(
-                operation_type="update", data={"range": cell_range, "values": values}
+        if self.record_operations:
+            self.operations.append(
+                WorksheetOperation(
+                    operation_type="update",
+                    data={"range": cell_range, "values": tuple(map(tuple, values))},
+                )
             )
-        )
 
     def delete_rows(self, start_index: int, end_index: int = None):
         """Delete row(s) by 1-based index (mirrors gspread API).
@@ -276,6 +374,7 @@ class MockWorksheet:
             end_index: If provided, delete rows from start_index to end_index (inclusive).
                        If not provided, delete a single row.
         """
+        self._records_cache = None
         if end_index is None:
             end_index = start_index
         # Convert to 0-based and delete in reverse to preserve indices
@@ -284,27 +383,37 @@ class MockWorksheet:
         for idx in range(end_0, start_0 - 1, -1):
             if 0 <= idx < len(self.rows):
                 self.rows.pop(idx)
-        self.operations.append(
-            WorksheetOperation(
-                operation_type="delete_rows",
-                data={"start": start_index, "end": end_index},
+        if self.record_operations:
+            self.operations.append(
+                WorksheetOperation(
+                    operation_type="delete_rows",
+                    data={"start": start_index, "end": end_index},
+                )
             )
-        )
 
     def sort(self, *args, **kwargs):
         """Mock sort operation (no-op for testing but tracked)."""
         self.sort_calls += 1
-        self.operations.append(
-            WorksheetOperation(
-                operation_type="sort", data={"args": args, "kwargs": kwargs}
+        if self.record_operations:
+            self.operations.append(
+                WorksheetOperation(
+                    operation_type="sort", data={"args": args, "kwargs": kwargs}
+                )
             )
-        )
 
     def clear(self):
-        """Clear all rows (keeps headers)."""
+        """Clear all rows (keeps headers).
+
+        Empties ``rows`` in place, so references obtained from
+        ``get_all_values()`` stay bound to this worksheet's (now empty) data.
+        """
         self.clear_calls += 1
-        self.rows = []
-        self.operations.append(WorksheetOperation(operation_type="clear", data=None))
+        self._records_cache = None
+        self.rows.clear()
+        if self.record_operations:
+            self.operations.append(
+                WorksheetOperation(operation_type="clear", data=None)
+            )
 
     def batch_clear(self, ranges: List[str]):
         """Clear specified ranges (like gspread's batch_clear).
@@ -315,21 +424,18 @@ class MockWorksheet:
         Args:
             ranges: List of range strings like ['A2:Z100']
         """
-        from emissions_tracker.utils import col_letter_to_idx
-
         self.clear_calls += 1
+        self._records_cache = None
         for range_str in ranges:
-            # Parse range like "A2:Z100"
-            if ":" in range_str:
-                start_cell, end_cell = range_str.split(":")
+            # Parse range like "A2:Z100" (or a single cell "A2")
+            start_col_letters, start_row, end_col_letters, end_row = _SPAN_RE.match(
+                range_str
+            ).groups()
+            start_row = int(start_row)
+            if end_col_letters is None:
+                end_col_letters, end_row = start_col_letters, start_row
             else:
-                start_cell = end_cell = range_str
-
-            # Parse column letters and row numbers
-            start_col_letters = "".join(c for c in start_cell if c.isalpha())
-            end_col_letters = "".join(c for c in end_cell if c.isalpha())
-            start_row = int("".join(c for c in start_cell if c.isdigit()))
-            end_row = int("".join(c for c in end_cell if c.isdigit()))
+                end_row = int(end_row)
 
             # Convert to 0-based indices
             start_row_idx = start_row - 1
@@ -356,9 +462,10 @@ class MockWorksheet:
                     ):
                         self.rows[row_idx][col_idx] = ""
 
-        self.operations.append(
-            WorksheetOperation(operation_type="batch_clear", data=ranges)
-        )
+        if self.record_operations:
+            self.operations.append(
+                WorksheetOperation(operation_type="batch_clear", data=tuple(ranges))
+            )
 
     @property
     def row_count(self) -> int:
@@ -372,9 +479,11 @@ class MockWorksheet:
         Args:
             records: List of dictionaries with keys matching headers
         """
-        for record in records:
-            row = [record.get(header, "") for header in self.headers]
-            self.rows.append(row)
+        self._records_cache = None
+        headers = self.headers
+        self.rows.extend(
+            [record.get(header, "") for header in headers] for record in records
+        )
 
 
 class MockSpreadsheet:
@@ -385,14 +494,24 @@ class MockSpreadsheet:
     batch updates across multiple sheets.
     """
 
-    def __init__(self, sheet_id: str):
+    __slots__ = (
+        "sheet_id",
+        "record_operations",
+        "_worksheets",
+        "batch_update_calls",
+        "values_batch_update_calls",
+    )
+
+    def __init__(self, sheet_id: str, record_operations: bool = False):
         """
         Initialize spreadsheet.
 
         Args:
             sheet_id: Spreadsheet ID
+            record_operations: Passed to every worksheet this spreadsheet creates
         """
         self.sheet_id = sheet_id
+        self.record_operations = record_operations
         self._worksheets: Dict[str, MockWorksheet] = {}
         self.batch_update_calls = 0
         self.values_batch_update_calls = 0
@@ -407,10 +526,7 @@ class MockSpreadsheet:
         Returns:
             MockWorksheet instance
         """
-        if name not in self._worksheets:
-            worksheet = MockWorksheet(name, spreadsheet=self)
-            self._worksheets[name] = worksheet
-        return self._worksheets[name]
+        return self._ensure_sheet(name)
 
     def add_worksheet(
         self, title: str, rows: int = 100, cols: int = 20
@@ -426,10 +542,17 @@ class MockSpreadsheet:
         Returns:
             MockWorksheet instance
         """
-        if title not in self._worksheets:
-            worksheet = MockWorksheet(title, spreadsheet=self)
-            self._worksheets[title] = worksheet
-        return self._worksheets[title]
+        return self._ensure_sheet(title)
+
+    def _ensure_sheet(self, name: str) -> MockWorksheet:
+        """Return the named worksheet, creating an empty one on first access."""
+        worksheet = self._worksheets.get(name)
+        if worksheet is None:
+            worksheet = MockWorksheet(
+                name, spreadsheet=self, record_operations=self.record_operations
+            )
+            self._worksheets[name] = worksheet
+        return worksheet
 
     def worksheets(self) -> List[MockWorksheet]:
         """Return all worksheets as a list (mirrors gspread API)."""
@@ -447,17 +570,21 @@ class MockSpreadsheet:
             body: Batch update request body with 'data' key containing updates
         """
         self.values_batch_update_calls += 1
+
+        # Group updates by sheet so each worksheet gets one batch_update call.
+        # Parse "SheetName!A2:B2" format once here and hand the resolved
+        # cells straight to the worksheet; unprefixed ranges are ignored.
+        grouped: Dict[str, Tuple[List[Tuple[int, int, Any]], List[Dict]]] = {}
         for update in body.get("data", []):
-            range_str = update["range"]
-            values = update["values"]
-
-            # Parse "SheetName!A2:B2" format
-            if "!" in range_str:
-                sheet_name, cell_range = range_str.split("!", 1)
-                if sheet_name in self._worksheets:
-                    self._worksheets[sheet_name].batch_update(
-                        [{"range": cell_range, "values": values}]
-                    )
+            match = _RANGE_RE.match(update["range"])
+            sheet_name = match.group(1) if match else None
+            if sheet_name in self._worksheets:
+                cells, updates = grouped.setdefault(sheet_name, ([], []))
+                cells.append(_cell_update(match, update))
+                updates.append(update)
+
+        for sheet_name, (cells, updates) in grouped.items():
+            self._worksheets[sheet_name]._apply_cells(cells, updates)
 
     def batch_update(self, body: Dict[str, Any]):
         """Batch update (alias for values_batch_update)."""
@@ -474,10 +601,13 @@ class MockSheetsClient:
     Mock gspread client that creates and tracks spreadsheets.
     """
 
-    def __init__(self):
+    __slots__ = ("spreadsheets", "open_by_key_calls", "record_operations")
+
+    def __init__(self, record_operations: bool = False):
         """Initialize client."""
         self.spreadsheets: Dict[str, MockSpreadsheet] = {}
         self.open_by_key_calls = 0
+        self.record_operations = record_operations
 
     def open_by_key(self, sheet_id: str) -> MockSpreadsheet:
         """
@@ -491,7 +621,9 @@ class MockSheetsClient:
         """
         self.open_by_key_calls += 1
         if sheet_id not in self.spreadsheets:
-            self.spreadsheets[sheet_id] = MockSpreadsheet(sheet_id)
+            self.spreadsheets[sheet_id] = MockSpreadsheet(
+                sheet_id, record_operations=self.record_operations
+            )
         return self.spreadsheets[sheet_id]
 
     def get_spreadsheet(self, sheet_id: str) -> Optional[MockSpreadsheet]:
@@ -504,9 +636,11 @@ class MockGspreadModule:
     Mock gspread module that provides authorize() method.
     """
 
-    def __init__(self):
+    __slots__ = ("client", "authorize_calls")
+
+    def __init__(self, record_operations: bool = False):
         """Initialize module."""
-        self.client = MockSheetsClient()
+        self.client = MockSheetsClient(record_operations=record_operations)
         self.authorize_calls = 0
 
     def authorize(self, credentials) -> MockSheetsClient:
@@ -530,11 +664,22 @@ class MockSheetsEnvironment:
     Provides high-level inspection methods for test verification.
     """
 
-    def __init__(self):
-        """Initialize environment."""
-        self.gspread_module = MockGspreadModule()
+    def __init__(self, record_operations: bool = False):
+        """Initialize environment.
+
+        Args:
+            record_operations: Have every worksheet keep an operations log.
+                Tests that assert on ``operations`` should enable it.
+        """
+        self.gspread_module = MockGspreadModule(record_operations=record_operations)
         self.client = self.gspread_module.client
 
+    def reset(self):
+        """Drop all spreadsheets and call counters so the environment can be reused."""
+        self.client.spreadsheets.clear()
+        self.client.open_by_key_calls = 0
+        self.gspread_module.authorize_calls = 0
+
     def get_spreadsheet(self, sheet_id: str) -> Optional[MockSpreadsheet]:
         """Get spreadsheet by ID."""
         return self.client.get_spreadsheet(sheet_id)
@@ -549,11 +694,39 @@ class MockSheetsEnvironment:
         return None
 
 
-@pytest.fixture(autouse=True)
-def mock_sheets():
+# Tracker modules whose gspread / ServiceAccountCredentials names get patched
+_TRACKER_MODULES = (
+    "emissions_tracker.trackers.contract_tracker",
+    "emissions_tracker.trackers.mining_tracker",
+    "emissions_tracker.trackers.payment_tracker",
+)
+
+# Stand-in ServiceAccountCredentials class, built once and reset per test
+_CREDS_CLASS = MagicMock()
+_CREDS_CLASS.from_json_keyfile_name.return_value = MagicMock()
+
+
+@pytest.fixture(scope="session")
+def mock_sheets_session():
+    """
+    Session-wide mock environment, built once and reset by ``mock_sheets``.
+
+    This fixture does not patch anything; the gspread patches are applied
+    per test by ``mock_sheets`` so that only tests depending on it see them.
+    """
+    return MockSheetsEnvironment()
+
+
+@pytest.fixture
+def mock_sheets(mock_sheets_session, request):
     """
     Pytest fixture that mocks `gspread for tracker tests.
 
+    Reuses the session environment, starting each test with no spreadsheets
+    and zeroed call counters. The gspread and credentials patches are only
+    active for the duration of the requesting test. Worksheets only keep an
+    ``operations`` log in tests marked ``@pytest.mark.record_sheet_ops``.
+
     Usage:
         def test_something(mock_sheets):
             tracker = BittensorEmissionTracker(..., sheet_id="test-123")
@@ -562,36 +735,28 @@ def mock_sheets():
             income_sheet = mock_sheets.get_worksheet("test-123", "Income")
             assert income_sheet.row_count == 5
     """
-    mock_env = MockSheetsEnvironment()
-
-    # Patch gspread module in all trackers
-    with patch(
-        "emissions_tracker.trackers.contract_tracker.gspread", mock_env.gspread_module
-    ), patch(
-        "emissions_tracker.trackers.mining_tracker.gspread", mock_env.gspread_module
-    ), patch(
-        "emissions_tracker.trackers.payment_tracker.gspread", mock_env.gspread_module
-    ):
-        mock_creds_class = MagicMock()
-        mock_creds_class.from_json_keyfile_name.return_value = MagicMock()
-
-        with patch(
-            "emissions_tracker.trackers.contract_tracker.ServiceAccountCredentials",
-            mock_creds_class,
-        ), patch(
-            "emissions_tracker.trackers.mining_tracker.ServiceAccountCredentials",
-            mock_creds_class,
-        ), patch(
-            "emissions_tracker.trackers.payment_tracker.ServiceAccountCredentials",
-            mock_creds_class,
-        ):
-            yield mock_env
+    mock_sheets_session.reset()
+    mock_sheets_session.client.record_operations = (
+        request.node.get_closest_marker("record_sheet_ops") is not None
+    )
+    _CREDS_CLASS.reset_mock()
+
+    # Patch gspread module and credentials in all trackers
+    patchers = []
+    for module in _TRACKER_MODULES:
+        patchers.append(patch(f"{module}.gspread", mock_sheets_session.gspread_module))
+        patchers.append(patch(f"{module}.ServiceAccountCredentials", _CREDS_CLASS))
+    for patcher in patchers:
+        patcher.start()
+    try:
+        yield mock_sheets_session
+    finally:
+        for patcher in reversed(patchers):
+            patcher.stop()
 
 
 @pytest.fixture()
 def mock_contract_sheet(mock_sheets):
-    from emissions_tracker.trackers.contract_tracker import SHEET_CONFIGS
-
     spreadsheet = mock_sheets.gspread_module.client.open_by_key(TEST_TRACKER_SHEET_ID)
     initialize_sheets(spreadsheet, SHEET_CONFIGS)
 
@@ -666,12 +831,6 @@ def seed_historical_lots(
             nominator: Nominator address for filtering contract income (optional)
             wallet_address: Wallet address for filtering deposits (optional)
         """
-        from emissions_tracker.trackers.contract_tracker import (
-            INCOME_SHEET,
-            TAO_LOTS_SHEET,
-            TRANSFERS_IN_SHEET,
-        )
-
         with get_alpha_lot_id.context():
 
             start_ts = int(start_date.timestamp())
@@ -700,26 +859,40 @@ def seed_historical_lots(
             )
 
             # Collect all lots (staking emissions + contract income) and sort chronologically
-            all_lots = [opening_alpha_lot] + income_lots + emission_lots
-            all_lots.sort(key=lambda x: x.timestamp)
-
-            # Create and append lots to the correct sheet based on source type
-            lot_counter = 1
-            income_sheet = spreadsheet.get_worksheet(INCOME_SHEET)
-            transfers_in_sheet = spreadsheet.get_worksheet(TRANSFERS_IN_SHEET)
-            for lot in all_lots:
+            all_lots = [opening_alpha_lot, *income_lots, *emission_lots]
+            all_lots.sort(key=attrgetter("timestamp"))
+
+            # Assign IDs and split lots by destination sheet, then write each
+            # sheet in a single append_rows call
+            income_rows = []
+            transfers_in_rows = []
+            for lot_counter, lot in enumerate(all_lots, start=1):
                 lot.lot_id = f"ALPHA-{lot_counter:04d}"
-                if lot.source_type == SourceType.TRANSFER_IN:
-                    transfers_in_sheet.append_row(lot.to_sheet_row())
+                if lot.source_type is SourceType.TRANSFER_IN:
+                    transfers_in_rows.append(lot.to_sheet_row())
                 else:
-                    income_sheet.append_row(lot.to_sheet_row())
-                lot_counter += 1
+                    income_rows.append(lot.to_sheet_row())
 
             # Seed TAO lots: opening lot + deposit lots
-            tao_sheet = spreadsheet.get_worksheet(TAO_LOTS_SHEET)
-            tao_sheet.append_row(opening_tao_lot.to_sheet_row())
-            for deposit_lot in deposit_lots:
-                tao_sheet.append_row(deposit_lot.to_sheet_row())
+            tao_rows = [opening_tao_lot.to_sheet_row()]
+            tao_rows.extend(deposit_lot.to_sheet_row() for deposit_lot in deposit_lots)
+
+            # Seeding is test setup, not tracker behaviour, so keep it out of
+            # the operations log
+            for sheet_name, rows in (
+                (INCOME_SHEET, income_rows),
+                (TRANSFERS_IN_SHEET, transfers_in_rows),
+                (TAO_LOTS_SHEET, tao_rows),
+            ):
+                if not rows:
+                    continue
+                worksheet = spreadsheet.get_worksheet(sheet_name)
+                record_operations = worksheet.record_operations
+                worksheet.record_operations = False
+                try:
+                    worksheet.append_rows(rows)
+                finally:
+                    worksheet.record_operations = record_operations
 
             return all_lots
 
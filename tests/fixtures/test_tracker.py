@@ -1,12 +1,14 @@
 import pytest
 
+from emissions_tracker.trackers.contract_tracker import ContractTracker
+from emissions_tracker.trackers.mining_tracker import MiningTracker
+from emissions_tracker.trackers.payment_tracker import PaymentTracker
+
 
 @pytest.fixture
-def contract_tracker(mock_taostats_client):
+def contract_tracker(mock_taostats_client, mock_sheets):
     """Create tracker instance with properly mocked dependencies."""
     # Create tracker normally through __init__
-    from emissions_tracker.trackers.contract_tracker import ContractTracker
-
     tracker = ContractTracker(
         price_client=mock_taostats_client,
         wallet_client=mock_taostats_client,
@@ -16,12 +18,10 @@ def contract_tracker(mock_taostats_client):
 
 
 @pytest.fixture
-def get_contract_tracker(mock_taostats_client):
+def get_contract_tracker(mock_taostats_client, mock_sheets):
     """Return a function that creates a contract tracker instance."""
 
     def _get_tracker():
-        from emissions_tracker.trackers.contract_tracker import ContractTracker
-
         tracker = ContractTracker(
             price_client=mock_taostats_client,
             wallet_client=mock_taostats_client,
@@ -32,10 +32,8 @@ def get_contract_tracker(mock_taostats_client):
 
 
 @pytest.fixture
-def mining_tracker(mock_mining_taostats_client):
+def mining_tracker(mock_mining_taostats_client, mock_sheets):
     """Create mining tracker instance with properly mocked dependencies."""
-    from emissions_tracker.trackers.mining_tracker import MiningTracker
-
     tracker = MiningTracker(
         price_client=mock_mining_taostats_client,
         wallet_client=mock_mining_taostats_client,
@@ -45,12 +43,10 @@ def mining_tracker(mock_mining_taostats_client):
 
 
 @pytest.fixture
-def get_mining_tracker(mock_mining_taostats_client):
+def get_mining_tracker(mock_mining_taostats_client, mock_sheets):
     """Return a function that creates a mining tracker instance."""
 
     def _get_tracker():
-        from emissions_tracker.trackers.mining_tracker import MiningTracker
-
         tracker = MiningTracker(
             price_client=mock_mining_taostats_client,
             wallet_client=mock_mining_taostats_client,
@@ -61,12 +57,10 @@ def get_mining_tracker(mock_mining_taostats_client):
 
 
 @pytest.fixture
-def get_payment_tracker(mock_taostats_client):
+def get_payment_tracker(mock_taostats_client, mock_sheets):
     """Return a function that creates a payment tracker instance."""
 
     def _get_tracker():
-        from emissions_tracker.trackers.payment_tracker import PaymentTracker
-
         tracker = PaymentTracker(
             price_client=mock_taostats_client,
             wallet_client=mock_taostats_client,
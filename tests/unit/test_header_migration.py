@@ -6,9 +6,7 @@ from tests.fixtures.mock_sheets import MockWorksheet
 
 def _ws_with_data(headers, rows):
     """Create a MockWorksheet pre-populated with a header row and data rows."""
-    ws = MockWorksheet("Test")
-    ws.rows.append(list(headers))
-    ws.headers = list(headers)
+    ws = MockWorksheet("Test", headers=headers)
     for row in rows:
         ws.rows.append(list(row))
     return ws
@@ -0,0 +1,51 @@
+"""Tests for MockWorksheet.get_all_records caching across writes."""
+
+from tests.fixtures.mock_sheets import MockWorksheet
+
+
+def _ws_with_data(headers, rows):
+    """Create a MockWorksheet pre-populated with a header row and data rows."""
+    ws = MockWorksheet("Test", headers=headers)
+    for row in rows:
+        ws.rows.append(list(row))
+    return ws
+
+
+class TestGetAllRecordsCache:
+
+    def test_append_row_after_read_is_visible(self):
+        ws = _ws_with_data(["A", "B"], [["1", "2"]])
+        assert ws.get_all_records() == [{"A": "1", "B": "2"}]
+
+        ws.append_row(["3", "4"])
+        assert ws.get_all_records() == [{"A": "1", "B": "2"}, {"A": "3", "B": "4"}]
+
+    def test_update_after_read_is_visible(self):
+        ws = _ws_with_data(["A", "B"], [["1", "2"]])
+        assert ws.get_all_records() == [{"A": "1", "B": "2"}]
+
+        ws.update("B2", [["9"]])
+        assert ws.get_all_records() == [{"A": "1", "B": "9"}]
+
+    def test_delete_rows_after_read_is_visible(self):
+        ws = _ws_with_data(["A", "B"], [["1", "2"], ["3", "4"]])
+        assert len(ws.get_all_records()) == 2
+
+        ws.delete_rows(2)
+        assert ws.get_all_records() == [{"A": "3", "B": "4"}]
+
+    def test_clear_after_read_is_visible(self):
+        ws = _ws_with_data(["A", "B"], [["1", "2"]])
+        assert len(ws.get_all_records()) == 1
+
+        ws.clear()
+        assert ws.get_all_records() == []
+
+    def test_mutating_result_list_does_not_affect_later_reads(self):
+        ws = _ws_with_data(["A", "B"], [["1", "2"]])
+        records = ws.get_all_records()
+        records.append({"A": "x", "B": "y"})
+        records.reverse()
+
+        assert ws.get_all_records() == [{"A": "1", "B": "2"}]
+        assert ws.get_all_records_calls == 2
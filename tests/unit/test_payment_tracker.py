@@ -35,7 +35,7 @@ def payment_client():
 
 
 @pytest.fixture
-def payment_tracker(payment_client):
+def payment_tracker(payment_client, mock_sheets):
     return PaymentTracker(
         price_client=payment_client,
         wallet_client=payment_client,
@@ -309,6 +309,36 @@ class TestPaymentSheetManagement:
         transfer_records = transfers_ws.get_all_records()
         assert len(transfer_records) == 2
 
+    @pytest.mark.record_sheet_ops
+    def test_write_clears_data_rows_before_appending(
+        self, payment_tracker, mock_sheets
+    ):
+        start = int(datetime(2025, 11, 1, tzinfo=timezone.utc).timestamp())
+        end = int(datetime(2025, 12, 5, tzinfo=timezone.utc).timestamp())
+
+        payment_tracker.run(start_time=start, end_time=end)
+
+        deposits_ws = mock_sheets.get_worksheet(
+            TEST_PAYMENT_TRACKER_SHEET_ID, "Deposits"
+        )
+        clear_op, append_op = deposits_ws.operations[-2:]
+        assert clear_op.operation_type == "batch_clear"
+        assert clear_op.data == ("A2:Z10000",)
+        assert append_op.operation_type == "append_rows"
+        assert len(append_op.data) == 2
+
+    def test_operations_not_recorded_without_marker(self, payment_tracker, mock_sheets):
+        start = int(datetime(2025, 11, 1, tzinfo=timezone.utc).timestamp())
+        end = int(datetime(2025, 12, 5, tzinfo=timezone.utc).timestamp())
+
+        payment_tracker.run(start_time=start, end_time=end)
+
+        deposits_ws = mock_sheets.get_worksheet(
+            TEST_PAYMENT_TRACKER_SHEET_ID, "Deposits"
+        )
+        assert deposits_ws.append_rows_calls > 0
+        assert deposits_ws.operations == []
+
     def test_clear_all_sheets(self, payment_tracker, mock_sheets):
         start = int(datetime(2025, 11, 1, tzinfo=timezone.utc).timestamp())
         end = int(datetime(2025, 12, 5, tzinfo=timezone.utc).timestamp())
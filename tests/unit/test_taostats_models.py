@@ -20,11 +20,13 @@ from emissions_tracker.models import (
     TaoStatsTransfer,
 )
 
+# Resolved once at import rather than on every load_json_file call
+TEST_DATA_ROOT = Path(__file__).parent.parent / "data"
+
 
 def load_json_file(filename: str, test_dir: str = "contract") -> Dict[str, Any]:
     """Load a JSON test data file."""
-    data_dir = Path(__file__).parent.parent / "data" / test_dir
-    with open(data_dir / filename, "r") as f:
+    with open(TEST_DATA_ROOT / test_dir / filename, "r") as f:
         return json.load(f)
 
 
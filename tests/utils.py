@@ -5,6 +5,7 @@ Contains common logic for processing balance history and delegation events
 that is used across multiple test modules.
 """
 
+from operator import itemgetter
 from typing import Dict, List
 
 from emissions_tracker.models import (
@@ -62,25 +63,33 @@ def compute_staking_emissions_from_balances(
     )
 
     emission_lots = []
-    for i in range(1, len(daily_balances)):
-        prev_day = daily_balances[i - 1]
-        curr_day = daily_balances[i]
+    if not daily_balances:
+        return emission_lots
+
+    # Carry the previous day's balance forward so each day's string->int
+    # conversion happens once rather than once as curr_day and again as prev_day
+    prev_alpha_rao = daily_balances[0].balance_as_alpha_rao
+    for curr_day in daily_balances[1:]:
+        curr_alpha_rao = curr_day.balance_as_alpha_rao
 
         # Get all events for current day (empty list for mining)
-        day_events = daily_stake_events.get(curr_day.day, [])
+        day_events = daily_stake_events.get(curr_day.day, ())
 
-        alpha_inflow_rao = sum(e.alpha for e in day_events if e.action == "DELEGATE")
-        alpha_outflow_rao = sum(e.alpha for e in day_events if e.action == "UNDELEGATE")
+        # Net delegation flow for the day in a single pass over its events
+        alpha_inflow_rao = 0
+        alpha_outflow_rao = 0
+        for e in day_events:
+            if e.action == "DELEGATE":
+                alpha_inflow_rao += e.alpha
+            elif e.action == "UNDELEGATE":
+                alpha_outflow_rao += e.alpha
 
         # Calculate alpha emissions in RAO
         # Balance change from end of previous day to end of current day (in RAO)
-        balance_change_alpha_rao = (
-            curr_day.balance_as_alpha_rao - prev_day.balance_as_alpha_rao
-        )
+        balance_change_alpha_rao = curr_alpha_rao - prev_alpha_rao
+        prev_alpha_rao = curr_alpha_rao
 
-        alpha_price_tao_rao = (
-            curr_day.balance_as_tao_rao / curr_day.balance_as_alpha_rao
-        )
+        alpha_price_tao_rao = curr_day.balance_as_tao_rao / curr_alpha_rao
 
         emissions_alpha_rao = (
             balance_change_alpha_rao - alpha_inflow_rao + alpha_outflow_rao
@@ -91,9 +100,8 @@ def compute_staking_emissions_from_balances(
             continue
 
         # Get TAO price for current day
-        timestamp = (
-            curr_day.timestamp_unix + SECONDS_PER_DAY - 1
-        )  # End of day timestamp
+        day_ts = curr_day.timestamp_unix
+        timestamp = day_ts + SECONDS_PER_DAY - 1  # End of day timestamp
         tao_price = get_tao_price_at_timestamp(timestamp)
 
         emissions_tao = (
@@ -106,7 +114,7 @@ def compute_staking_emissions_from_balances(
         emission_lots.append(
             AlphaLot(
                 lot_id=get_lot_id(),
-                timestamp=curr_day.timestamp_unix,
+                timestamp=day_ts,
                 block_number=curr_day.block_number,
                 alpha_rao=emissions_alpha_rao,
                 alpha_rao_remaining=emissions_alpha_rao,
@@ -133,13 +141,14 @@ def filter_balances_by_date_range(
     Returns:
         Filtered list of balance records
     """
-    balances = [
-        b
+    # Parse each timestamp once and reuse it for both the filter and the sort
+    stamped = [
+        (ts, b)
         for b in daily_stake_balances.values()
-        if start_ts <= b.timestamp_unix <= end_ts
+        if start_ts <= (ts := b.timestamp_unix) <= end_ts
     ]
-    balances.sort(key=lambda x: x.timestamp_unix)
-    return balances
+    stamped.sort(key=itemgetter(0))
+    return [b for _, b in stamped]
 
 
 def filter_delegation_events_by_date_range(
@@ -346,11 +355,14 @@ def consume_tao_lots(
 
     consumed_lots: list[TaoLotConsumption] = []
 
-    available_lots: list[TaoLot] = [
+    # Lazily walk the pre-sorted lots so the scan stops as soon as the
+    # outflow is covered instead of filtering the whole lot list per transfer
+    transfer_ts = taostats_transfer.timestamp_unix
+    available_lots = (
         lot
         for lot in tao_lots
-        if lot.timestamp <= taostats_transfer.timestamp_unix and lot.rao_remaining > 0
-    ]
+        if lot.timestamp <= transfer_ts and lot.rao_remaining > 0
+    )
 
     # Total outflow includes both transfer amount and fee (both reduce wallet balance)
     total_outflow_rao = taostats_transfer.amount_rao + taostats_transfer.fee_rao